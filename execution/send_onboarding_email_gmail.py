@@ -3,12 +3,18 @@
 
 import argparse
 import base64
+from contextlib import closing
 import csv
 from datetime import datetime, timezone, timedelta
 from email.message import EmailMessage
+import functools
+import itertools
 import logging
 import os
+import re
+import sqlite3
 import sys
+from typing import Iterator, List, Optional, Sequence, Tuple
 
 try:
     from google.auth.transport.requests import Request
@@ -22,6 +28,9 @@ except ImportError as exc:
     ) from exc
 
 SCOPES = ["https://www.googleapis.com/auth/gmail.send"]
+BATCH_SIZE = 50  # Gmail allows 100 calls per batch; smaller batches stay clear of rate limits
+TEMPLATE_PLACEHOLDER_RE = re.compile(r"\{(first_name|sender_name|scheduling_line)\}")
+LOG_HEADER = ["timestamp_utc", "recipient", "subject", "sender", "message_id", "template_version"]
 
 
 def load_env() -> None:
@@ -33,8 +42,13 @@ def load_env() -> None:
         load_dotenv(".env")
 
 
+@functools.lru_cache(maxsize=4)
 def get_credentials(credentials_path: str, token_path: str) -> Credentials:
-    """Get Google OAuth credentials with logging."""
+    """Get Google OAuth credentials with logging.
+
+    Memoized per (credentials_path, token_path) so repeated sends in one process
+    don't re-read token.json or repeat the refresh round-trip.
+    """
     creds = None
     if os.path.exists(token_path):
         logging.debug(f"Loading existing token from {token_path}")
@@ -53,39 +67,252 @@ def get_credentials(credentials_path: str, token_path: str) -> Credentials:
     return creds
 
 
-def send_email(creds: Credentials, sender: str, recipient: str, subject: str, body: str) -> str:
-    """Send email via Gmail API with logging."""
-    logging.info(f"Sending email to {recipient} with subject: {subject}")
-    service = build("gmail", "v1", credentials=creds)
+@functools.lru_cache(maxsize=1)
+def get_gmail_service(creds: Credentials):
+    """Build the Gmail API client once per credentials object.
+
+    Reusing the client keeps its authorized HTTP connection open across sends.
+    The discovery document is loaded from the copy bundled with the client library.
+    """
+    logging.debug("Building Gmail API service")
+    return build("gmail", "v1", credentials=creds, cache_discovery=False, static_discovery=True)
+
+
+def build_raw_message(sender: str, recipient: str, subject: str, body: str) -> str:
+    """Encode an email as the base64url payload expected by the Gmail API."""
     message = EmailMessage()
     message["To"] = recipient
     message["From"] = sender
     message["Subject"] = subject
     message.set_content(body)
-    raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
+    return base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
+
+
+def send_email(creds: Credentials, sender: str, recipient: str, subject: str, body: str) -> str:
+    """Send email via Gmail API with logging."""
+    logging.info(f"Sending email to {recipient} with subject: {subject}")
+    service = get_gmail_service(creds)
+    raw_message = build_raw_message(sender, recipient, subject, body)
     response = service.users().messages().send(userId="me", body={"raw": raw_message}).execute()
     message_id = response.get("id", "")
     logging.info(f"Email sent successfully, message ID: {message_id}")
     return message_id
 
 
-def log_send(log_path: str, recipient: str, subject: str, sender: str, message_id: str, template_version: str) -> None:
-    """Log email send to CSV."""
-    os.makedirs(os.path.dirname(log_path), exist_ok=True)
-    file_exists = os.path.exists(log_path)
-    with open(log_path, "a", encoding="utf-8", newline="") as handle:
-        writer = csv.writer(handle)
+def send_emails_batch(creds: Credentials, messages: Sequence[Tuple[str, str, str, str]]) -> List[str]:
+    """Send several emails through Gmail batch requests of up to BATCH_SIZE calls.
+
+    Each message is a (sender, recipient, subject, body) tuple. Returns message IDs in
+    input order; a send that failed is logged and returned as an empty string.
+    """
+    service = get_gmail_service(creds)
+    message_ids = [""] * len(messages)
+
+    def _collect_id(request_id: str, response: dict, exception: Exception) -> None:
+        index = int(request_id)
+        if exception is not None:
+            logging.error(f"Failed to send email to {messages[index][1]}: {exception}")
+            return
+        message_ids[index] = response.get("id", "")
+
+    pending = iter(enumerate(messages))
+    while True:
+        chunk = list(itertools.islice(pending, BATCH_SIZE))
+        if not chunk:
+            break
+        batch = service.new_batch_http_request(callback=_collect_id)
+        for index, (sender, recipient, subject, body) in chunk:
+            raw_message = build_raw_message(sender, recipient, subject, body)
+            batch.add(service.users().messages().send(userId="me", body={"raw": raw_message}), request_id=str(index))
+        logging.info(f"Sending batch of {len(chunk)} emails")
+        batch.execute()
+    sent = sum(1 for message_id in message_ids if message_id)
+    logging.info(f"Batch send complete: {sent}/{len(messages)} emails sent")
+    return message_ids
+
+
+def _index_path(log_path: str) -> str:
+    return log_path + ".idx.sqlite"
+
+
+def _index_key(recipient: str, subject: str, sender: str, template_version: str) -> str:
+    return f"{recipient}\x1f{subject}\x1f{sender}\x1f{template_version}"
+
+
+def _log_signature(log_path: str) -> Tuple[int, int]:
+    """Return the CSV log's (size, mtime_ns), or (0, 0) if it doesn't exist."""
+    try:
+        stat = os.stat(log_path)
+    except FileNotFoundError:
+        return 0, 0
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _store_log_signature(conn: sqlite3.Connection, log_path: str) -> None:
+    size, mtime_ns = _log_signature(log_path)
+    conn.executemany(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+        (("csv_size", size), ("csv_mtime_ns", mtime_ns)),
+    )
+
+
+def open_send_index(log_path: str) -> sqlite3.Connection:
+    """Open the sidecar dedupe index for a send log.
+
+    The index records the CSV's size and mtime; if the CSV no longer matches (it was
+    edited, truncated, or replaced), the index is rebuilt from the CSV.
+    """
+    conn = sqlite3.connect(_index_path(log_path), isolation_level=None)
+    try:
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("CREATE TABLE IF NOT EXISTS sends (key TEXT PRIMARY KEY, ts TEXT)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)")
+            stored = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            size, mtime_ns = _log_signature(log_path)
+            if stored.get("csv_size") != size or stored.get("csv_mtime_ns") != mtime_ns:
+                conn.execute("DELETE FROM sends")
+                if os.path.exists(log_path):
+                    logging.info(f"Building send index from {log_path}")
+                    with open(log_path, "r", encoding="utf-8", newline="") as handle:
+                        reader = csv.reader(handle)
+                        next(reader, None)  # header
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO sends (key, ts) VALUES (?, ?)",
+                            ((_index_key(row[1], row[2], row[3], row[5]), row[0]) for row in reader if len(row) >= 6),
+                        )
+                _store_log_signature(conn, log_path)
+    except Exception:
+        conn.close()
+        raise
+    return conn
+
+
+def _discard_index(log_path: str) -> None:
+    """Remove the send index so it is rebuilt from the CSV on next use."""
+    try:
+        os.remove(_index_path(log_path))
+    except FileNotFoundError:
+        pass
+
+
+class LogWriter:
+    """Append sends to the CSV log and dedupe index, opening each once for any number of sends.
+
+    The index is opened (and validated against the CSV) on entry. Rows are buffered and
+    flushed when the context exits, then recorded in the index together with the CSV's
+    new size and mtime in one transaction.
+    """
+
+    def __init__(self, log_path: str) -> None:
+        self.log_path = log_path
+        self._handle = None
+        self._writer = None
+        self._index: Optional[sqlite3.Connection] = None
+        self._pending: List[Tuple[str, str]] = []
+
+    def __enter__(self) -> "LogWriter":
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        try:
+            self._index = open_send_index(self.log_path)
+        except sqlite3.Error as exc:
+            logging.warning(f"Send index unavailable, it will be rebuilt on next use: {exc}")
+            self._index = None
+        file_exists = os.path.exists(self.log_path)
+        self._handle = open(self.log_path, "a", encoding="utf-8", newline="", buffering=1 << 16)
+        self._writer = csv.writer(self._handle)
         if not file_exists:
-            writer.writerow(["timestamp_utc", "recipient", "subject", "sender", "message_id", "template_version"])
-        writer.writerow([
-            datetime.now(timezone.utc).isoformat(),
+            self._writer.writerow(LOG_HEADER)
+        return self
+
+    def append(self, recipient: str, subject: str, sender: str, message_id: str, template_version: str) -> None:
+        timestamp = datetime.now(timezone.utc).isoformat()
+        self._writer.writerow([
+            timestamp,
             recipient,
             subject,
             sender,
             message_id,
             template_version,
         ])
-    logging.debug(f"Logged send to {log_path}")
+        self._pending.append((_index_key(recipient, subject, sender, template_version), timestamp))
+        logging.debug(f"Logged send to {self.log_path}")
+
+    def __exit__(self, exc_type: Optional[type], exc: Optional[BaseException], tb: object) -> None:
+        self._handle.close()
+        if self._index is None:
+            _discard_index(self.log_path)
+            return
+        try:
+            with closing(self._index) as conn, conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany("INSERT OR REPLACE INTO sends (key, ts) VALUES (?, ?)", self._pending)
+                _store_log_signature(conn, self.log_path)
+        except sqlite3.Error as index_error:
+            logging.warning(f"Failed to update send index, it will be rebuilt on next use: {index_error}")
+            _discard_index(self.log_path)
+        self._index = None
+        self._pending = []
+
+
+def log_send(log_path: str, recipient: str, subject: str, sender: str, message_id: str, template_version: str) -> None:
+    """Log a single email send to CSV and update the dedupe index."""
+    with LogWriter(log_path) as log_writer:
+        log_writer.append(recipient, subject, sender, message_id, template_version)
+
+
+def _iter_lines_reversed(path: str, chunk_size: int = 65536) -> Iterator[str]:
+    """Yield the lines of a file from last to first, reading fixed-size chunks from the end."""
+    with open(path, "rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            handle.seek(position)
+            lines = (handle.read(read_size) + remainder).split(b"\n")
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                yield line.rstrip(b"\r").decode("utf-8", errors="replace")
+        yield remainder.rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+def _scan_log_for_duplicate(
+    log_path: str,
+    recipient: str,
+    subject: str,
+    sender: str,
+    template_version: str,
+    cutoff_iso: str,
+) -> bool:
+    """Scan the CSV log backwards for a matching send newer than cutoff_iso."""
+    pending = None
+    for line in _iter_lines_reversed(log_path):
+        if pending is not None:
+            line = f"{line}\n{pending}"
+        # An odd number of quotes means a quoted field spans lines; keep joining earlier lines.
+        if line.count('"') % 2:
+            pending = line
+            continue
+        pending = None
+        row = next(csv.reader([line]), None)
+        if not row or len(row) < 6:
+            continue
+        sent_at, row_recipient, row_subject, row_sender, _message_id, row_template_version = row[:6]
+        if len(sent_at) < 19:
+            continue
+        if sent_at < cutoff_iso:
+            # The log is append-only, so every earlier row is older still.
+            break
+        if (
+            row_recipient == recipient
+            and row_subject == subject
+            and row_sender == sender
+            and row_template_version == template_version
+        ):
+            logging.warning(f"Duplicate found: email to {recipient} sent at {sent_at}")
+            return True
+    return False
 
 
 def should_skip_send(
@@ -100,42 +327,43 @@ def should_skip_send(
     if not os.path.exists(log_path):
         logging.debug(f"No log file found at {log_path}, proceeding with send")
         return False
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=window_hours)
-    logging.debug(f"Checking for duplicates within {window_hours} hours (since {cutoff.isoformat()})")
-    with open(log_path, "r", encoding="utf-8", newline="") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            try:
-                sent_at = datetime.fromisoformat(row.get("timestamp_utc", ""))
-            except ValueError:
-                continue
-            if sent_at.tzinfo is None:
-                sent_at = sent_at.replace(tzinfo=timezone.utc)
-            if sent_at < cutoff:
-                continue
-            if (
-                row.get("recipient") == recipient
-                and row.get("subject") == subject
-                and row.get("sender") == sender
-                and row.get("template_version") == template_version
-            ):
-                logging.warning(f"Duplicate found: email to {recipient} sent at {sent_at.isoformat()}")
-                return True
-    return False
+    # Timestamps are written by datetime.isoformat() in UTC, so they order correctly as strings.
+    cutoff_iso = (datetime.now(timezone.utc) - timedelta(hours=window_hours)).isoformat()
+    logging.debug(f"Checking for duplicates within {window_hours} hours (since {cutoff_iso})")
+    try:
+        with closing(open_send_index(log_path)) as conn:
+            row = conn.execute(
+                "SELECT ts FROM sends WHERE key = ?",
+                (_index_key(recipient, subject, sender, template_version),),
+            ).fetchone()
+    except sqlite3.Error as exc:
+        logging.warning(f"Send index unavailable, scanning {log_path}: {exc}")
+        return _scan_log_for_duplicate(log_path, recipient, subject, sender, template_version, cutoff_iso)
+    if row is None:
+        return False
+    sent_at = row[0]
+    if len(sent_at) < 19 or sent_at < cutoff_iso:
+        return False
+    logging.warning(f"Duplicate found: email to {recipient} sent at {sent_at}")
+    return True
+
+
+@functools.lru_cache(maxsize=8)
+def _load_template(template_path: str, mtime: float) -> str:
+    """Read a template file; keyed on mtime so edits are picked up without re-reading unchanged files."""
+    logging.debug(f"Loading template from {template_path}")
+    with open(template_path, "r", encoding="utf-8") as handle:
+        return handle.read()
 
 
 def build_onboarding_body(first_name: str, scheduling_link: str, sender_name: str, template_path: str = "") -> str:
     """Build email body from template file or default template."""
     if template_path and os.path.exists(template_path):
-        logging.debug(f"Loading template from {template_path}")
-        with open(template_path, "r", encoding="utf-8") as handle:
-            template = handle.read()
-        # Replace placeholders
+        template = _load_template(template_path, os.path.getmtime(template_path))
+        # Replace placeholders in a single pass; other braces in the template are left alone
         scheduling_line = f"We'll schedule our kickoff call ({scheduling_link})" if scheduling_link else "I'll follow up with a kickoff time"
-        body = template.replace("{first_name}", first_name)
-        body = body.replace("{sender_name}", sender_name)
-        body = body.replace("{scheduling_line}", scheduling_line)
-        return body
+        values = {"first_name": first_name, "sender_name": sender_name, "scheduling_line": scheduling_line}
+        return TEMPLATE_PLACEHOLDER_RE.sub(lambda match: values[match.group(1)], template)
     else:
         # Fallback to hardcoded template
         lines = [
@@ -249,7 +477,8 @@ def main() -> int:
 
     creds = get_credentials(args.credentials, args.token)
     message_id = send_email(creds, args.sender, args.to, args.subject, body)
-    log_send(args.log_path, args.to, args.subject, args.sender, message_id, args.template_version)
+    with LogWriter(args.log_path) as log_writer:
+        log_writer.append(args.to, args.subject, args.sender, message_id, args.template_version)
     logging.info(f"Completed successfully, message ID: {message_id}")
     print(f"Sent message id: {message_id}")
     return 0
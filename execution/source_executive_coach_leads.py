@@ -5,19 +5,36 @@ from __future__ import annotations
 
 import argparse
 import base64
+import codecs
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 import csv
 from dataclasses import dataclass
 from datetime import datetime
-import html
-from html.parser import HTMLParser
+import functools
+import hashlib
 import logging
 import os
 import re
 import sys
+import tempfile
+import threading
 import time
-from typing import List, Optional, Sequence
+from typing import Callable, DefaultDict, List, Optional, Sequence, Set, Tuple
 from urllib.parse import parse_qs, quote_plus, urlparse
-from urllib.request import Request, urlopen
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError as exc:
+    raise SystemExit("Missing dependencies. Install: pip install requests selectolax") from exc
+
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None
 
 try:
     from google.auth.transport.requests import Request as GoogleRequest
@@ -33,7 +50,14 @@ USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36
 DEFAULT_LIMIT = 3
 REQUEST_DELAY = 1.0  # seconds between requests to avoid rate limiting
 MAX_RETRIES = 3
-RETRY_DELAY = 2.0  # seconds between retries
+RETRY_DELAY = 2.0  # backoff factor in seconds; doubles on each consecutive retry
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRY_AFTER = 4 * RETRY_DELAY  # cap on server-requested waits; the per-host lock is held while waiting
+FETCH_WORKERS = 8  # concurrent page fetches; REQUEST_DELAY still applies per host
+MAX_PAGE_BYTES = 1024 * 1024  # read at most this much of each response body
+MAX_CONTENT_LENGTH = 10 * 1024 * 1024  # skip responses that declare a larger body
+PAGE_CACHE_DIR = os.path.join(".tmp", "page_cache")
+PAGE_CACHE_TTL = 24 * 60 * 60  # seconds before a cached page is fetched again
 
 EAST_COAST_STATES = [
     ("Maine", "ME"),
@@ -88,6 +112,12 @@ EXCLUDE_KEYWORDS = [
     "it",
 ]
 
+COACH_PHRASES = [
+    "executive coach",
+    "executive coaching",
+    "leadership coach",
+]
+
 SPECIALTY_KEYWORDS = [
     "leadership",
     "c-suite",
@@ -104,6 +134,41 @@ SPECIALTY_KEYWORDS = [
     "succession",
 ]
 
+# Single-word excludes ("cto", "devops") are matched as whole words so they don't fire inside "director";
+# plural and adverb forms ("CTOs", "developers", "technically") count as the same word.
+_EXCLUDE_WORD_RE = re.compile(
+    r"\b(?:"
+    + "|".join(re.escape(keyword) for keyword in EXCLUDE_KEYWORDS if " " not in keyword and keyword != "it")
+    + r")(?:s|ly)?\b"
+)
+# "it" only means the acronym, so it is matched as "IT" case-sensitively; otherwise the pronoun excludes every page.
+# An "IT" next to another all-caps word is a shouted pronoun ("GET IT NOW"), not the acronym.
+_IT_RE = re.compile(r"\bIT\b")
+_WORD_BEFORE_RE = re.compile(r"([A-Za-z']+)[^A-Za-z']*$")
+_WORD_AFTER_RE = re.compile(r"[^A-Za-z']*([A-Za-z']+)")
+_EXCLUDE_PHRASES = [keyword for keyword in EXCLUDE_KEYWORDS if " " in keyword]
+_KEYWORDS = list(dict.fromkeys(COACH_PHRASES + _EXCLUDE_PHRASES + SPECIALTY_KEYWORDS))
+
+
+def _build_keyword_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+_CHARSET_RE = re.compile(r"charset=([\w-]+)")
+_LINKEDIN_RE = re.compile(r"https?://(?:www\.)?linkedin\.com/[\w\-/%?=&#.]+", re.IGNORECASE)
+# "City, ST" for any East Coast state abbreviation, in a single scan.
+_LOCATION_RE = re.compile(
+    r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*(" + "|".join(abbr for _, abbr in EAST_COAST_STATES) + r")\b"
+)
+
 
 def load_env() -> None:
     if os.path.exists(".env"):
@@ -125,87 +190,160 @@ class Lead:
     evidence: str
 
 
-class BingResultParser(HTMLParser):
-    def __init__(self) -> None:
-        super().__init__()
-        self.links: List[str] = []
-        self._in_result = False
+class _CappedRetry(Retry):
+    """Retry that honors Retry-After but never waits longer than MAX_RETRY_AFTER."""
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    retry = _CappedRetry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_DELAY,
+        status_forcelist=RETRY_STATUSES,
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=16, pool_maxsize=32)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
-    def handle_starttag(self, tag: str, attrs: List[tuple[str, Optional[str]]]) -> None:
-        attrs_dict = dict(attrs)
-        if tag == "li" and "class" in attrs_dict and "b_algo" in (attrs_dict.get("class") or ""):
-            self._in_result = True
-            return
-        if tag == "a" and self._in_result:
-            href = attrs_dict.get("href")
-            if href:
-                self.links.append(href)
-
-    def handle_endtag(self, tag: str) -> None:
-        if tag == "li" and self._in_result:
-            self._in_result = False
-
-class TextExtractor(HTMLParser):
-    def __init__(self) -> None:
-        super().__init__()
-        self.parts: List[str] = []
-        self._skip_depth = 0
-
-    def handle_starttag(self, tag: str, attrs: List[tuple[str, Optional[str]]]) -> None:
-        if tag in {"script", "style"}:
-            self._skip_depth += 1
-
-    def handle_endtag(self, tag: str) -> None:
-        if tag in {"script", "style"} and self._skip_depth > 0:
-            self._skip_depth -= 1
-
-    def handle_data(self, data: str) -> None:
-        if self._skip_depth:
-            return
-        cleaned = " ".join(data.split())
-        if cleaned:
-            self.parts.append(cleaned)
 
-    def text(self) -> str:
-        return " ".join(self.parts)
+_SESSION = _build_session()
+_HOST_LOCKS: DefaultDict[str, threading.Lock] = defaultdict(threading.Lock)
+_HOST_LOCKS_GUARD = threading.Lock()
 
 
-def fetch_url(url: str, timeout: int = 20, retries: int = MAX_RETRIES) -> str:
-    """Fetch URL with retry logic."""
-    last_error = None
-    for attempt in range(retries):
+def fetch_url(url: str, timeout: int = 20) -> str:
+    """Fetch URL. Retries with backoff (honoring Retry-After) are handled by the session adapter."""
+    try:
+        with _SESSION.get(url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            content_length = response.headers.get("Content-Length", "")
+            if content_length.isdigit() and int(content_length) > MAX_CONTENT_LENGTH:
+                raise ValueError(f"Response too large ({content_length} bytes)")
+            content_type = response.headers.get("Content-Type", "")
+            charset_match = _CHARSET_RE.search(content_type)
+            encoding = charset_match.group(1) if charset_match else "utf-8"
+            try:
+                decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+            except LookupError:
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            parts = []
+            received = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                parts.append(decoder.decode(chunk[: MAX_PAGE_BYTES - received]))
+                received += len(chunk)
+                if received >= MAX_PAGE_BYTES:
+                    break
+            parts.append(decoder.decode(b"", final=True))
+            return "".join(parts)
+    except Exception as exc:
+        logging.error(f"Fetch failed: {url} - {exc}")
+        raise
+
+
+def _host_lock(url: str) -> threading.Lock:
+    host = urlparse(url).netloc.lower()
+    with _HOST_LOCKS_GUARD:
+        return _HOST_LOCKS[host]
+
+
+def _page_cache_path(url: str) -> str:
+    return os.path.join(PAGE_CACHE_DIR, f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.html")
+
+
+def _read_page_cache(url: str) -> Optional[str]:
+    path = _page_cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) > PAGE_CACHE_TTL:
+            return None
+        with open(path, "r", encoding="utf-8") as handle:
+            return handle.read()
+    except OSError:
+        return None
+
+
+def _write_page_cache(url: str, text: str) -> None:
+    try:
+        os.makedirs(PAGE_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=PAGE_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(text)
+            os.replace(tmp_path, _page_cache_path(url))
+        except OSError:
+            os.remove(tmp_path)
+            raise
+    except OSError as exc:
+        logging.warning(f"Failed to cache page {url}: {exc}")
+
+
+def fetch_page(url: str, should_cache: Optional[Callable[[str], bool]] = None) -> str:
+    """Fetch URL through the page cache, spacing requests to the same host at least REQUEST_DELAY apart.
+
+    should_cache, if given, decides whether a freshly fetched page is written to the cache.
+    """
+    cached = _read_page_cache(url)
+    if cached is not None:
+        logging.debug(f"Page cache hit: {url}")
+        return cached
+    with _host_lock(url):
         try:
-            request = Request(url, headers={"User-Agent": USER_AGENT})
-            with urlopen(request, timeout=timeout) as response:
-                content_type = response.headers.get("Content-Type", "")
-                charset_match = re.search(r"charset=([\\w-]+)", content_type)
-                encoding = charset_match.group(1) if charset_match else "utf-8"
-                data = response.read()
-                return data.decode(encoding, errors="replace")
-        except Exception as exc:
-            last_error = exc
-            if attempt < retries - 1:
-                logging.warning(f"Fetch failed (attempt {attempt + 1}/{retries}): {url} - {exc}")
-                time.sleep(RETRY_DELAY)
-            else:
-                logging.error(f"Fetch failed after {retries} attempts: {url} - {exc}")
-    raise last_error if last_error else Exception("Failed to fetch URL")
-
-
-def extract_title(html_text: str) -> str:
-    match = re.search(r"<title[^>]*>(.*?)</title>", html_text, re.IGNORECASE | re.DOTALL)
-    if not match:
+            text = fetch_url(url)
+        finally:
+            time.sleep(REQUEST_DELAY)  # Rate limit per host
+    if should_cache is None or should_cache(text):
+        _write_page_cache(url, text)
+    return text
+
+
+def _fetch_candidate_page(url: str) -> Optional[str]:
+    try:
+        return fetch_page(url)
+    except Exception as exc:
+        logging.warning(f"Failed to fetch {url}: {exc}")
+        return None
+
+
+def extract_title(tree: LexborHTMLParser) -> str:
+    node = tree.css_first("title")
+    if node is None:
         return ""
-    return html.unescape(match.group(1)).strip()
+    return node.text(strip=True)
 
 
-def extract_h1(html_text: str) -> str:
-    match = re.search(r"<h1[^>]*>(.*?)</h1>", html_text, re.IGNORECASE | re.DOTALL)
-    if not match:
+def extract_h1(tree: LexborHTMLParser) -> str:
+    node = tree.css_first("h1")
+    if node is None:
         return ""
-    text = re.sub(r"<[^>]+>", " ", match.group(1))
-    return html.unescape(" ".join(text.split())).strip()
+    return " ".join(node.text(separator=" ").split())
+
+def extract_text(tree: LexborHTMLParser) -> str:
+    """Return visible page text with script/style removed and whitespace collapsed."""
+    for node in tree.css("script, style"):
+        node.decompose()
+    return " ".join(tree.text(separator=" ").split())
 
+
+def extract_result_links(html_text: str) -> List[str]:
+    """Return the hrefs inside Bing organic result items."""
+    tree = LexborHTMLParser(html_text)
+    links = []
+    for node in tree.css("li.b_algo a[href]"):
+        href = node.attributes.get("href")
+        if href:
+            links.append(href)
+    return links
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_bing_link(link: str) -> str:
     if "bing.com/ck/a" not in link:
         return link
@@ -226,16 +364,15 @@ def normalize_bing_link(link: str) -> str:
     return link
 
 
-def bing_search(query: str, max_results: int = 10) -> List[str]:
-    """Search Bing with rate limiting."""
-    time.sleep(REQUEST_DELAY)  # Rate limit
+@functools.lru_cache(maxsize=256)
+def bing_search(query: str, max_results: int = 10) -> Tuple[str, ...]:
+    """Search Bing with rate limiting. Results are cached per query for the life of the process."""
     url = f"https://www.bing.com/search?q={quote_plus(query)}"
-    html_text = fetch_url(url)
-    parser = BingResultParser()
-    parser.feed(html_text)
+    # A 200 captcha/consent page has no results; caching it would blank this query for a day.
+    html_text = fetch_page(url, should_cache=lambda text: bool(extract_result_links(text)))
     results = []
     seen = set()
-    for link in parser.links:
+    for link in extract_result_links(html_text):
         normalized = normalize_bing_link(link)
         if not normalized.startswith("http"):
             continue
@@ -246,51 +383,85 @@ def bing_search(query: str, max_results: int = 10) -> List[str]:
         if len(results) >= max_results:
             break
     logging.info(f"Found {len(results)} results for query: {query}")
-    return results
+    return tuple(results)
+
 
+def match_keywords(text: str, text_lower: Optional[str] = None) -> Set[str]:
+    """Return the coach, exclude, and specialty keywords found in text, in a single pass when possible."""
+    lower = text.lower() if text_lower is None else text_lower
+    if _KEYWORD_AUTOMATON is None:
+        return {keyword for keyword in _KEYWORDS if keyword in lower}
+    return {keyword for _, keyword in _KEYWORD_AUTOMATON.iter(lower)}
 
-def contains_excluded_keywords(text: str) -> bool:
-    lower = text.lower()
-    return any(keyword in lower for keyword in EXCLUDE_KEYWORDS)
 
+def _is_all_caps_word(match: Optional[re.Match]) -> bool:
+    if match is None:
+        return False
+    word = match.group(1).replace("'", "")
+    return len(word) > 1 and word.isupper()
 
-def looks_like_executive_coach(text: str) -> bool:
-    lower = text.lower()
-    return "executive coach" in lower or "executive coaching" in lower or "leadership coach" in lower
+
+def mentions_it_acronym(text: str) -> bool:
+    """Return True if text uses "IT" as the acronym rather than inside an all-caps phrase."""
+    for match in _IT_RE.finditer(text):
+        before = _WORD_BEFORE_RE.search(text, max(0, match.start() - 40), match.start())
+        after = _WORD_AFTER_RE.match(text, match.end(), match.end() + 40)
+        if not _is_all_caps_word(before) and not _is_all_caps_word(after):
+            return True
+    return False
+
+
+def contains_excluded_keywords(
+    text: str,
+    keywords: Optional[Set[str]] = None,
+    text_lower: Optional[str] = None,
+) -> bool:
+    found = match_keywords(text, text_lower) if keywords is None else keywords
+    if any(phrase in found for phrase in _EXCLUDE_PHRASES):
+        return True
+    if mentions_it_acronym(text):
+        return True
+    lower = text.lower() if text_lower is None else text_lower
+    return _EXCLUDE_WORD_RE.search(lower) is not None
+
+
+def looks_like_executive_coach(text: str, keywords: Optional[Set[str]] = None) -> bool:
+    found = match_keywords(text) if keywords is None else keywords
+    return any(phrase in found for phrase in COACH_PHRASES)
 
 
 def extract_linkedin(html_text: str) -> str:
-    match = re.search(r"https?://(?:www\\.)?linkedin\\.com/[\\w\\-/%?=&#.]+", html_text, re.IGNORECASE)
+    match = _LINKEDIN_RE.search(html_text)
     if match:
         return match.group(0).rstrip(").,")
     return ""
 
 
-def extract_location(text: str) -> str:
-    for state_name, state_abbr in EAST_COAST_STATES:
-        pattern = rf"\\b([A-Z][a-z]+(?:\\s+[A-Z][a-z]+)?),\\s*{state_abbr}\\b"
-        match = re.search(pattern, text)
-        if match:
-            return f"{match.group(1)}, {state_abbr}"
-        if state_name.lower() in text.lower():
+def extract_location(text: str, text_lower: Optional[str] = None) -> str:
+    match = _LOCATION_RE.search(text)
+    if match:
+        return f"{match.group(1)}, {match.group(2)}"
+    lower = text.lower() if text_lower is None else text_lower
+    for state_name, _ in EAST_COAST_STATES:
+        if state_name.lower() in lower:
             return state_name
     return ""
 
 
-def extract_specialty(text: str) -> str:
-    lower = text.lower()
+def extract_specialty(text: str, keywords: Optional[Set[str]] = None) -> str:
+    matched = match_keywords(text) if keywords is None else keywords
     found = []
     for keyword in SPECIALTY_KEYWORDS:
-        if keyword in lower:
+        if keyword in matched:
             found.append(keyword)
-    if not found:
-        return ""
-    return ", ".join(found[:3])
+            if len(found) == 3:
+                break
+    return ", ".join(found)
 
 
-def extract_evidence(text: str) -> str:
-    lowered = text.lower()
-    for phrase in ["executive coach", "executive coaching", "leadership coach"]:
+def extract_evidence(text: str, text_lower: Optional[str] = None) -> str:
+    lowered = text.lower() if text_lower is None else text_lower
+    for phrase in COACH_PHRASES:
         idx = lowered.find(phrase)
         if idx != -1:
             start = max(0, idx - 60)
@@ -334,84 +505,93 @@ def build_candidates(limit: int) -> List[Lead]:
     search_targets = EAST_COAST_CITIES + [state for state, _ in EAST_COAST_STATES]
     logging.info(f"Starting search for {limit} leads across {len(search_targets)} locations")
 
-    for target in search_targets:
-        for seed in SEARCH_SEEDS:
-            if len(leads) >= limit:
-                logging.info(f"Reached target of {limit} leads")
-                return leads
-            query = f'"{seed}" "{target}"'
-            try:
-                results = bing_search(query, max_results=10)
-            except Exception as exc:
-                logging.error(f"Search failed for query '{query}': {exc}")
-                continue
-            for link in results:
+    # Page fetches for each query run concurrently, but never more at once than leads still needed;
+    # leads are still processed in result order.
+    executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+    try:
+        for target in search_targets:
+            for seed in SEARCH_SEEDS:
                 if len(leads) >= limit:
+                    logging.info(f"Reached target of {limit} leads")
                     return leads
-                parsed = urlparse(link)
-                domain = parsed.netloc.lower()
-                if not domain or domain in seen_domains:
-                    continue
-                if "linkedin.com" in domain:
-                    continue
-                seen_domains.add(domain)
+                query = f'"{seed}" "{target}"'
                 try:
-                    html_text = fetch_url(link)
-                    time.sleep(REQUEST_DELAY)  # Rate limit between page fetches
+                    results = bing_search(query, max_results=10)
                 except Exception as exc:
-                    logging.warning(f"Failed to fetch {link}: {exc}")
+                    logging.error(f"Search failed for query '{query}': {exc}")
                     continue
-                title = extract_title(html_text)
-                h1 = extract_h1(html_text)
-                text_extractor = TextExtractor()
-                text_extractor.feed(html_text)
-                text = text_extractor.text()
-                if not looks_like_executive_coach(text):
-                    logging.debug(f"Skipping {link}: doesn't look like executive coach")
-                    continue
-                if contains_excluded_keywords(text):
-                    logging.debug(f"Skipping {link}: contains excluded keywords")
-                    continue
-                name = guess_name(title, h1)
-                location = extract_location(text)
-                if not location and "," in target:
-                    location = target
-                elif not location:
-                    location = target
-                linkedin_url = extract_linkedin(html_text)
-                if not linkedin_url:
-                    linkedin_url = search_linkedin(name)
-                specialty = extract_specialty(text)
-                evidence = extract_evidence(text)
-                lead = Lead(
-                    name=name or "Unknown",
-                    role="Executive Coach",
-                    website_url=link,
-                    linkedin_url=linkedin_url,
-                    location=location,
-                    specialty=specialty,
-                    evidence=evidence,
-                )
-                leads.append(lead)
-                logging.info(f"Added lead #{len(leads)}: {lead.name} from {location}")
+                links = []
+                for link in results:
+                    parsed = urlparse(link)
+                    domain = parsed.netloc.lower()
+                    if not domain or domain in seen_domains:
+                        continue
+                    if "linkedin.com" in domain:
+                        continue
+                    seen_domains.add(domain)
+                    links.append(link)
+                remaining_links = iter(links)
+                in_flight = deque()
+                while True:
+                    while len(in_flight) < min(FETCH_WORKERS, limit - len(leads)):
+                        next_link = next(remaining_links, None)
+                        if next_link is None:
+                            break
+                        in_flight.append((next_link, executor.submit(_fetch_candidate_page, next_link)))
+                    if not in_flight:
+                        break
+                    link, future = in_flight.popleft()
+                    html_text = future.result()
+                    if html_text is None:
+                        continue
+                    tree = LexborHTMLParser(html_text)
+                    title = extract_title(tree)
+                    h1 = extract_h1(tree)
+                    text = extract_text(tree)
+                    text_lower = text.lower()
+                    keywords = match_keywords(text, text_lower)
+                    if not looks_like_executive_coach(text, keywords):
+                        logging.debug(f"Skipping {link}: doesn't look like executive coach")
+                        continue
+                    if contains_excluded_keywords(text, keywords, text_lower):
+                        logging.debug(f"Skipping {link}: contains excluded keywords")
+                        continue
+                    name = guess_name(title, h1)
+                    location = extract_location(text, text_lower)
+                    if not location and "," in target:
+                        location = target
+                    elif not location:
+                        location = target
+                    linkedin_url = extract_linkedin(html_text)
+                    if not linkedin_url:
+                        linkedin_url = search_linkedin(name)
+                    specialty = extract_specialty(text, keywords)
+                    evidence = extract_evidence(text, text_lower)
+                    lead = Lead(
+                        name=name or "Unknown",
+                        role="Executive Coach",
+                        website_url=link,
+                        linkedin_url=linkedin_url,
+                        location=location,
+                        specialty=specialty,
+                        evidence=evidence,
+                    )
+                    leads.append(lead)
+                    logging.info(f"Added lead #{len(leads)}: {lead.name} from {location}")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
     return leads
 
 
 def write_csv(leads: Sequence[Lead], path: str) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8", newline="") as handle:
+    with open(path, "w", encoding="utf-8", newline="", buffering=1 << 20) as handle:
         writer = csv.writer(handle)
         writer.writerow(["name", "role", "website_url", "linkedin_url", "location", "specialty", "evidence"])
-        for lead in leads:
-            writer.writerow([
-                lead.name,
-                lead.role,
-                lead.website_url,
-                lead.linkedin_url,
-                lead.location,
-                lead.specialty,
-                lead.evidence,
-            ])
+        writer.writerows(
+            (lead.name, lead.role, lead.website_url, lead.linkedin_url, lead.location, lead.specialty, lead.evidence)
+            for lead in leads
+        )
 
 
 def get_credentials(credentials_path: str, token_path: str) -> "Credentials":
@@ -437,9 +617,6 @@ def get_credentials(credentials_path: str, token_path: str) -> "Credentials":
 def write_google_sheet(leads: Sequence[Lead], credentials_path: str, token_path: str, title: str) -> str:
     creds = get_credentials(credentials_path, token_path)
     service = build("sheets", "v4", credentials=creds)
-    sheet_body = {"properties": {"title": title}}
-    spreadsheet = service.spreadsheets().create(body=sheet_body, fields="spreadsheetId").execute()
-    spreadsheet_id = spreadsheet["spreadsheetId"]
     values = [["name", "role", "website_url", "linkedin_url", "location", "specialty", "evidence"]]
     for lead in leads:
         values.append([
@@ -451,13 +628,19 @@ def write_google_sheet(leads: Sequence[Lead], credentials_path: str, token_path:
             lead.specialty,
             lead.evidence,
         ])
-    body = {"values": values}
-    service.spreadsheets().values().update(
-        spreadsheetId=spreadsheet_id,
-        range="Sheet1!A1",
-        valueInputOption="RAW",
-        body=body,
-    ).execute()
+    # Create the spreadsheet with its rows in one request instead of create + values().update.
+    row_data = [{"values": [{"userEnteredValue": {"stringValue": value}} for value in row]} for row in values]
+    sheet_body = {
+        "properties": {"title": title},
+        "sheets": [
+            {
+                "properties": {"title": "Sheet1"},
+                "data": [{"startRow": 0, "startColumn": 0, "rowData": row_data}],
+            }
+        ],
+    }
+    spreadsheet = service.spreadsheets().create(body=sheet_body, fields="spreadsheetId").execute()
+    spreadsheet_id = spreadsheet["spreadsheetId"]
     return f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}"
 
 
@@ -494,20 +677,28 @@ def main() -> int:
         print("No leads found.")
         return 1
 
-    write_csv(leads, args.csv_path)
+    has_credentials = os.path.exists(args.credentials)
+    sheet_url = ""
+    sheet_error: Optional[Exception] = None
+    # Write the CSV in the background while the Google Sheet request is in flight.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        csv_future = executor.submit(write_csv, leads, args.csv_path)
+        if has_credentials:
+            sheet_title = f"Executive Coach Leads - {datetime.now().strftime('%Y-%m-%d')}"
+            try:
+                sheet_url = write_google_sheet(leads, args.credentials, args.token, sheet_title)
+            except Exception as exc:
+                sheet_error = exc
+        csv_future.result()
     logging.info(f"Wrote {len(leads)} leads to CSV: {args.csv_path}")
     print(f"Wrote CSV to {args.csv_path}")
 
-    if not os.path.exists(args.credentials):
+    if not has_credentials:
         print(f"Missing credentials file: {args.credentials}")
         print("Skipping Google Sheet creation.")
         return 0
-
-    sheet_title = f"Executive Coach Leads - {datetime.now().strftime('%Y-%m-%d')}"
-    try:
-        sheet_url = write_google_sheet(leads, args.credentials, args.token, sheet_title)
-    except Exception as exc:
-        print(f"Google Sheet creation failed: {exc}")
+    if sheet_error is not None:
+        print(f"Google Sheet creation failed: {sheet_error}")
         return 0
     print(f"Google Sheet: {sheet_url}")
     return 0